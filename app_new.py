@@ -6,6 +6,8 @@ from bokeh.plotting import figure
 from bokeh.embed import components
 from bokeh.models import HoverTool
 from bokeh.palettes import Category20
+from thumbnails import build_thumbnails, find_thumbnails
+from search_index import SearchIndex, DEFAULT_LIMIT
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,6 +32,22 @@ def load_data():
 # Global data loading
 df = load_data()
 
+# Sparkline previews for the pickers, rendered by `python thumbnails.py`
+def load_thumbnails(data, render=False):
+    """Look up (or render) indicator thumbnails with proper error handling"""
+    try:
+        thumbnails = build_thumbnails(data) if render else find_thumbnails(data)
+        logger.info(f"{len(thumbnails)} indicator thumbnails ready")
+        return thumbnails
+    except Exception as e:
+        logger.error(f"Error building thumbnails: {e}")
+        return {}
+
+THUMBNAILS = load_thumbnails(df)
+
+# Typeahead index over indicators, countries and data sources
+search_index = SearchIndex(df)
+
 # Categories and indicators configuration
 CATEGORIES = {
     "economy": {
@@ -222,6 +240,7 @@ def index():
     return render_template('index_new.html', 
                          title="Pacific Economy Dashboard",
                          categories=CATEGORIES,
+                         thumbnails=THUMBNAILS,
                          data_info=f"Dataset contains {len(df)} records" if not df.empty else "No data available")
 
 @app.route('/visualize', methods=['POST'])
@@ -236,6 +255,7 @@ def visualize():
             return render_template('index_new.html', 
                                  title="Pacific Economy Dashboard",
                                  categories=CATEGORIES,
+                                 thumbnails=THUMBNAILS,
                                  data_info=f"Dataset contains {len(df)} records" if not df.empty else "No data available")
         
         # Get indicator title
@@ -249,6 +269,7 @@ def visualize():
             return render_template('index_new.html', 
                                  title="Pacific Economy Dashboard",
                                  categories=CATEGORIES,
+                                 thumbnails=THUMBNAILS,
                                  selected_category=category,
                                  selected_indicator=indicator,
                                  data_info="No data available for selected indicator")
@@ -263,6 +284,7 @@ def visualize():
         return render_template('index_new.html',
                              title="Pacific Economy Dashboard",
                              categories=CATEGORIES,
+                             thumbnails=THUMBNAILS,
                              selected_category=category,
                              selected_indicator=indicator,
                              indicator_title=indicator_title,
@@ -277,15 +299,27 @@ def visualize():
         return render_template('index_new.html', 
                              title="Pacific Economy Dashboard",
                              categories=CATEGORIES,
+                             thumbnails=THUMBNAILS,
                              data_info="Error occurred")
 
+@app.route('/api/search')
+def search():
+    """Typeahead search over indicators, countries and data sources"""
+    query = request.args.get('q', '').strip()
+    limit = request.args.get('limit', DEFAULT_LIMIT, type=int)
+    return {
+        'query': query,
+        'results': search_index.search(query, limit)
+    }
+
 @app.route('/health')
 def health():
     """Health check endpoint"""
     return {
         'status': 'healthy',
         'data_loaded': not df.empty,
-        'data_rows': len(df)
+        'data_rows': len(df),
+        'thumbnails': len(THUMBNAILS)
     }
 
 if __name__ == '__main__':
@@ -296,4 +330,7 @@ if __name__ == '__main__':
     logger.info(f"Debug mode: {debug}")
     logger.info(f"Data status: {'Loaded' if not df.empty else 'Failed'}")
     
+    # Single local process, so render any missing thumbnails before serving
+    THUMBNAILS = load_thumbnails(df, render=True)
+    
     app.run(host='0.0.0.0', port=port, debug=debug)
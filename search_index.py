@@ -0,0 +1,100 @@
+"""
+In-memory prefix index over indicators, countries and data sources.
+
+The index is built once when the dataset is loaded. Every word of every label
+(and code) is expanded into its prefixes, so typeahead queries are answered with
+dictionary lookups and set intersections instead of scans of the DataFrame.
+"""
+
+import re
+
+# (result type, code column, label column) for each searchable field
+SEARCH_FIELDS = [
+    ('indicator', 'INDICATOR', 'Indicator'),
+    ('country', 'GEO_PICT', 'Pacific Island Countries and territories'),
+    ('data_source', None, 'DATA_SOURCE'),
+]
+MAX_PREFIX_LENGTH = 20
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric words"""
+    return _TOKEN_RE.findall(str(text).lower())
+
+class SearchIndex:
+    """Prefix index answering ranked typeahead queries"""
+
+    def __init__(self, data):
+        self.entries = []
+        self.prefixes = {}
+        if data.empty:
+            return
+
+        for kind, code_column, label_column in SEARCH_FIELDS:
+            if label_column not in data.columns:
+                continue
+            if code_column in data.columns:
+                counts = data[[code_column, label_column]].dropna().groupby([code_column, label_column]).size()
+                for (code, label), count in counts.items():
+                    self._add(kind, str(code), str(label), int(count))
+            else:
+                counts = data[label_column].dropna().value_counts()
+                for label, count in counts.items():
+                    self._add(kind, str(label), str(label), int(count))
+
+        # Most observed entries first, so single-prefix lookups come out ranked
+        for prefix, ids in self.prefixes.items():
+            self.prefixes[prefix] = sorted(ids, key=lambda i: -self.entries[i]['count'])
+
+    def _add(self, kind, code, label, count):
+        """Register an entry and every word prefix of its code and label"""
+        entry_id = len(self.entries)
+        self.entries.append({
+            'type': kind,
+            'code': code,
+            'label': label,
+            'count': count,
+        })
+        words = set(tokenize(label)) | set(tokenize(code))
+        for word in words:
+            for end in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1):
+                self.prefixes.setdefault(word[:end], set()).add(entry_id)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Return up to limit entries matching every word of query, best first"""
+        limit = min(max(limit, 1), MAX_LIMIT)
+        words = tokenize(query)
+        if not words:
+            return []
+
+        candidates = None
+        for word in sorted(words, key=len, reverse=True):
+            ids = self.prefixes.get(word[:MAX_PREFIX_LENGTH])
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates & set(ids)
+            if not candidates:
+                return []
+
+        if len(words) == 1:
+            ranked = [i for i in self.prefixes[words[0][:MAX_PREFIX_LENGTH]] if i in candidates]
+        else:
+            ranked = sorted(candidates, key=lambda i: -self.entries[i]['count'])
+
+        needle = ' '.join(words)
+        ranked.sort(key=lambda i: self._match_rank(self.entries[i], needle))
+        return [dict(self.entries[i]) for i in ranked[:limit]]
+
+    @staticmethod
+    def _match_rank(entry, needle):
+        """Exact matches first, then label/code prefixes, then word prefixes"""
+        label = ' '.join(tokenize(entry['label']))
+        code = ' '.join(tokenize(entry['code']))
+        if needle in (label, code):
+            return 0
+        if label.startswith(needle) or code.startswith(needle):
+            return 1
+        return 2
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the top-level modules (app.py, thumbnails.py, ...) importable from tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
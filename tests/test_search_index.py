@@ -0,0 +1,56 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from search_index import MAX_LIMIT, SearchIndex
+
+
+def make_data():
+    rows = []
+    for code, label, country, geo, source, n in [
+        ('SL_TLF_UEM', '8.5.2 Unemployment rate', 'Fiji', 'FJ', 'Labour Force Survey 2016', 5),
+        ('SL_TLF_NEET', '8.6.1 Youth not in education, employment or training', 'Samoa', 'WS', 'Labour Force Survey 2017', 3),
+        ('SL_EMP_EARN', '8.5.1 Average hourly earnings', 'Fiji', 'FJ', 'Household Income and Expenditure Survey 2013', 2),
+        ('SPC_8_9_1', '8.9.1 Tourism direct GDP', 'Tonga', 'TO', 'Tourism Satellite Account', 1),
+        ('SPC_8_9_1OUT', '8.9.1 Tourism outbound expenditure', 'Tonga', 'TO', 'Tourism Satellite Account', 4),
+    ]:
+        rows += [{'INDICATOR': code, 'Indicator': label, 'GEO_PICT': geo,
+                  'Pacific Island Countries and territories': country, 'DATA_SOURCE': source}] * n
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def index():
+    return SearchIndex(make_data())
+
+
+def test_exact_code_ranks_first(index):
+    # SPC_8_9_1OUT also matches and has more observations; the exact code still wins
+    results = index.search('SPC_8_9_1')
+    assert [r['code'] for r in results] == ['SPC_8_9_1', 'SPC_8_9_1OUT']
+
+
+def test_multi_word_query_intersects(index):
+    results = index.search('labour 2017')
+    assert [r['label'] for r in results] == ['Labour Force Survey 2017']
+
+    codes = [r['code'] for r in index.search('sl tlf')]
+    assert codes == ['SL_TLF_UEM', 'SL_TLF_NEET']
+
+
+def test_observation_counts(index):
+    results = index.search('fiji')
+    assert results == [{'type': 'country', 'code': 'FJ', 'label': 'Fiji', 'count': 7}]
+
+
+@pytest.mark.parametrize('query', ['', '   ', '_-.', 'zzz', 'fiji zzz'])
+def test_empty_or_unmatched_query(index, query):
+    assert index.search(query) == []
+
+
+def test_limit_is_clamped():
+    rows = [{'INDICATOR': f'CODE_{i}', 'Indicator': f'Indicator {i}'} for i in range(MAX_LIMIT + 10)]
+    index = SearchIndex(pd.DataFrame(rows))
+    assert len(index.search('indicator', limit=1000)) == MAX_LIMIT
+    assert len(index.search('indicator', limit=0)) == 1
+    assert len(index.search('indicator', limit=3)) == 3
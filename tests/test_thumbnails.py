@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('matplotlib')
+
+from thumbnails import build_thumbnails
+
+
+def make_data(uem_values=(5.0, 6.0, 7.0)):
+    rows = [{'INDICATOR': 'SL_TLF_UEM', 'TIME_PERIOD': 2015 + i, 'OBS_VALUE': v}
+            for i, v in enumerate(uem_values)]
+    rows += [{'INDICATOR': 'SL_TLF_NEET', 'TIME_PERIOD': 2015 + i, 'OBS_VALUE': v}
+             for i, v in enumerate((20.0, 22.5, 21.0))]
+    return pd.DataFrame(rows)
+
+
+def snapshot(directory):
+    return {name: os.stat(os.path.join(directory, name)).st_mtime_ns
+            for name in os.listdir(directory)}
+
+
+def test_second_build_renders_nothing(tmp_path):
+    build_thumbnails(make_data(), output_dir=str(tmp_path), max_workers=1)
+    first = snapshot(tmp_path)
+    assert len(first) == 2
+
+    build_thumbnails(make_data(), output_dir=str(tmp_path), max_workers=1)
+    assert snapshot(tmp_path) == first
+
+
+def test_changed_indicator_replaces_only_its_file(tmp_path):
+    build_thumbnails(make_data(), output_dir=str(tmp_path), max_workers=1)
+    first = snapshot(tmp_path)
+
+    build_thumbnails(make_data((5.0, 6.0, 9.0)), output_dir=str(tmp_path), max_workers=1)
+    second = snapshot(tmp_path)
+
+    old_uem = [name for name in first if name.startswith('SL_TLF_UEM-')]
+    new_uem = [name for name in second if name.startswith('SL_TLF_UEM-')]
+    neet = [name for name in first if name.startswith('SL_TLF_NEET-')]
+    assert len(old_uem) == len(new_uem) == 1
+    assert old_uem != new_uem
+    assert old_uem[0] not in second
+    assert second[neet[0]] == first[neet[0]]
+    assert len(second) == 2
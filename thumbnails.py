@@ -0,0 +1,154 @@
+"""
+Sparkline thumbnail previews for the indicator pickers.
+
+Each indicator gets a small static image of its yearly mean OBS_VALUE. Files are
+named after a hash of the indicator's rows and the render settings, so a
+thumbnail is only re-rendered when its data or its look changes and is otherwise
+served at static-file cost.
+
+Rendering is a build step (`python thumbnails.py`); the web app only looks up
+the files that already exist.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+THUMBNAILS_DIR = os.path.join('static', 'visualizations', 'thumbnails')
+THUMBNAIL_FORMATS = ('png', 'svg')
+THUMBNAIL_SIZE = (1.6, 0.4)  # inches; 160x40 px at the default dpi
+THUMBNAIL_DPI = 100
+THUMBNAIL_COLOR = '#3182ce'
+# Bump when the plotting code changes so existing thumbnails are re-rendered
+RENDER_VERSION = 1
+
+def indicator_series(data, indicator):
+    """Return the (years, values) sparkline series for an indicator"""
+    filtered = data[data['INDICATOR'] == indicator]
+    values = pd.to_numeric(filtered['OBS_VALUE'], errors='coerce')
+    series = values.groupby(filtered['TIME_PERIOD']).mean().dropna().sort_index()
+    return [str(year) for year in series.index], series.tolist()
+
+def dataset_hash(years, values):
+    """Hash the sparkline series and render settings into a cache key"""
+    digest = hashlib.sha1()
+    digest.update(f"v{RENDER_VERSION}:{THUMBNAIL_SIZE}:{THUMBNAIL_DPI}:{THUMBNAIL_COLOR};".encode('utf-8'))
+    for year, value in zip(years, values):
+        digest.update(f"{year}:{value!r};".encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+def thumbnail_filename(indicator, digest, fmt='png'):
+    """Build the on-disk file name for an indicator thumbnail"""
+    return f"{indicator}-{digest}.{fmt}"
+
+def render_thumbnail(values, path):
+    """Render a single sparkline to path (runs inside a worker process)
+
+    The image is written to a temporary file next to path and moved into place,
+    so an interrupted render never leaves a truncated file in the cache.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fmt = os.path.splitext(path)[1].lstrip('.')
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+    os.close(fd)
+    fig, ax = plt.subplots(figsize=THUMBNAIL_SIZE, dpi=THUMBNAIL_DPI)
+    try:
+        x = range(len(values))
+        ax.plot(x, values, color=THUMBNAIL_COLOR, linewidth=1.5)
+        ax.fill_between(x, values, min(values), color=THUMBNAIL_COLOR, alpha=0.15)
+        ax.plot(len(values) - 1, values[-1], 'o', color=THUMBNAIL_COLOR, markersize=3)
+        ax.set_axis_off()
+        ax.margins(x=0.02, y=0.1)
+        fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+        fig.savefig(tmp_path, format=fmt, transparent=True)
+        os.replace(tmp_path, path)
+    finally:
+        plt.close(fig)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+def _plan_thumbnails(data, target_dir, fmt):
+    """Map each plottable indicator to (values, expected thumbnail path)"""
+    plan = {}
+    for indicator in sorted(data['INDICATOR'].dropna().unique()):
+        years, values = indicator_series(data, indicator)
+        if len(values) < 2:
+            continue
+        plan[indicator] = (values, os.path.join(target_dir, thumbnail_filename(indicator, dataset_hash(years, values), fmt)))
+    return plan
+
+def _resolve_dirs(output_dir):
+    """Return absolute (thumbnail, static) directories for output_dir"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, output_dir), os.path.join(current_dir, 'static')
+
+def find_thumbnails(data, output_dir=THUMBNAILS_DIR, fmt='png'):
+    """Return {indicator: static-relative path} for thumbnails already on disk
+
+    Cheap enough to call at import time: nothing is rendered or deleted.
+    """
+    if data.empty or fmt not in THUMBNAIL_FORMATS:
+        return {}
+
+    target_dir, static_dir = _resolve_dirs(output_dir)
+    return {indicator: os.path.relpath(path, static_dir).replace(os.sep, '/')
+            for indicator, (values, path) in _plan_thumbnails(data, target_dir, fmt).items()
+            if os.path.exists(path)}
+
+def build_thumbnails(data, output_dir=THUMBNAILS_DIR, fmt='png', max_workers=None):
+    """Render missing or stale thumbnails and return {indicator: relative path}
+
+    Relative paths are relative to the static folder, ready for
+    url_for('static', ...). Rendering is spread over a process pool; indicators
+    whose hash already has a file on disk are skipped entirely, and files from
+    older versions of the data are removed.
+    """
+    if data.empty or fmt not in THUMBNAIL_FORMATS:
+        return {}
+
+    target_dir, _ = _resolve_dirs(output_dir)
+    os.makedirs(target_dir, exist_ok=True)
+
+    plan = _plan_thumbnails(data, target_dir, fmt)
+    pending = {indicator: (values, path) for indicator, (values, path) in plan.items()
+               if not os.path.exists(path)}
+
+    if pending:
+        logger.info(f"Rendering {len(pending)} of {len(plan)} indicator thumbnails")
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {indicator: pool.submit(render_thumbnail, values, path)
+                       for indicator, (values, path) in pending.items()}
+            for indicator, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error rendering thumbnail for {indicator}: {e}")
+
+    _remove_stale(target_dir, fmt, {os.path.basename(path) for values, path in plan.values()})
+    return find_thumbnails(data, output_dir, fmt)
+
+def _remove_stale(target_dir, fmt, keep):
+    """Delete thumbnails left behind by previous versions of the dataset"""
+    for name in os.listdir(target_dir):
+        if name.endswith(f".{fmt}") and name not in keep:
+            try:
+                os.remove(os.path.join(target_dir, name))
+            except OSError as e:
+                logger.warning(f"Could not remove stale thumbnail {name}: {e}")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    csv_path = os.path.join(current_dir, 'data', 'Sustainable Development Goal 08 - Decent Work and Economic Growth data.csv')
+    built = build_thumbnails(pd.read_csv(csv_path))
+    logger.info(f"{len(built)} thumbnails available in {THUMBNAILS_DIR}")